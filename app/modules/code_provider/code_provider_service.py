@@ -28,3 +28,10 @@ class CodeProviderService:
         return self.service_instance.get_file_content(
             repo_name, file_path, start_line, end_line, branch_name, project_id
         )
+
+    async def get_file_content_async(
+        self, repo_name, file_path, start_line, end_line, branch_name, project_id
+    ):
+        return await self.service_instance.get_file_content_async(
+            repo_name, file_path, start_line, end_line, branch_name, project_id
+        )
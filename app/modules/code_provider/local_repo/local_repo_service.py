@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import logging
 import os
 import re
@@ -56,11 +57,11 @@ class LocalRepoService:
             repo.git.checkout(branch_name)
             file_full_path = os.path.join(repo_path, file_path)
             with open(file_full_path, "r", encoding="utf-8") as file:
-                lines = file.readlines()
                 if (start_line == end_line == 0) or (start_line == end_line == None):
-                    return "".join(lines)
+                    return file.read()
                 start = start_line - 2 if start_line - 2 > 0 else 0
-                selected_lines = lines[start:end_line]
+                # Read only up to end_line instead of loading every line of the file
+                selected_lines = itertools.islice(file, start, end_line)
                 return "".join(selected_lines)
         except Exception as e:
             logger.error(
@@ -72,6 +73,25 @@ class LocalRepoService:
                 detail=f"Error processing file content: {str(e)}",
             )
 
+    async def get_file_content_async(
+        self,
+        repo_name: str,
+        file_path: str,
+        start_line: int,
+        end_line: int,
+        branch_name: str,
+        project_id: str,
+    ) -> str:
+        return await asyncio.to_thread(
+            self.get_file_content,
+            repo_name,
+            file_path,
+            start_line,
+            end_line,
+            branch_name,
+            project_id,
+        )
+
     async def get_project_structure_async(
         self, project_id: str, path: Optional[str] = None
     ) -> str:
@@ -91,7 +91,7 @@ class ChangeDetectionTool:
                     project_id
                 )
                 code_service = CodeProviderService(self.sql_db)
-                file_content = code_service.get_file_content(
+                file_content = await code_service.get_file_content_async(
                     project["project_name"],
                     relative_file_path,
                     0,
@@ -216,12 +216,15 @@ class ChangeDetectionTool:
         code_service = CodeProviderService(self.sql_db)
         try:
             if isinstance(code_service.service_instance, GithubService):
-                github, _, _ = code_service.service_instance.get_github_repo_details(
+                github_service = code_service.service_instance
+                github, _, _ = await github_service.get_github_repo_details_async(
                     repo_name
                 )
-                repo = github.get_repo(repo_name)
+                repo = await asyncio.to_thread(github.get_repo, repo_name)
                 default_branch = repo.default_branch
-                git_diff = repo.compare(default_branch, branch_name)
+                git_diff = await asyncio.to_thread(
+                    repo.compare, default_branch, branch_name
+                )
                 patches_dict = {
                     file.filename: file.patch for file in git_diff.files if file.patch
                 }
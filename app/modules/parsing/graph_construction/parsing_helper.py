@@ -11,6 +11,7 @@ from git import GitCommandError, Repo
 from sqlalchemy.orm import Session
 
 from app.modules.code_provider.code_provider_service import CodeProviderService
+from app.modules.code_provider.github.github_service import GithubService
 from app.modules.parsing.graph_construction.parsing_schema import RepoDetails
 from app.modules.projects.projects_schema import ProjectStatusEnum
 from app.modules.projects.projects_service import ProjectService
@@ -486,6 +487,11 @@ class ParseHelper:
             latest_commit_id = branch.commit.sha
 
             is_up_to_date = current_commit_id == latest_commit_id
+            if not is_up_to_date and isinstance(
+                self.github_service.service_instance, GithubService
+            ):
+                # The branch moved, so cached file contents and branches are stale
+                self.github_service.service_instance.invalidate_repo_cache(repo_name)
             logger.info(
                 f"""Project {project_id} commit status for branch {branch_name}: {'Up to date' if is_up_to_date else 'Outdated'}"
             Current commit ID: {current_commit_id}